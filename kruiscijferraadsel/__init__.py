@@ -5,7 +5,7 @@ import string
 from collections import defaultdict
 from copy import deepcopy
 from enum import Enum
-from typing import Dict, FrozenSet, List, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 import attr
 import numpy as np
@@ -264,6 +264,88 @@ class CrossNumber:
             self.parse_uniques()
             self.filter()
 
+    def propagate(self):
+        """Run `solve` until no more options can be eliminated.
+
+        Every step that does not end the loop removes at least one option, so
+        the number of remaining options bounds the number of steps needed.
+        """
+        self.solve(max_steps=self.score + len(self.sections) + 2)
+
+    def snapshot(self) -> Dict[str, Set[str]]:
+        return {key: set(section.options) for key, section in self.sections.items()}
+
+    def restore(self, snapshot: Dict[str, Set[str]]):
+        for key, options in snapshot.items():
+            self.sections[key].options = set(options)
+
+    @property
+    def has_duplicates(self):
+        """Check if several solved sections share the same number."""
+        solved = [len(section.options) == 1 for section in self.sections.values()]
+        return len(self.uniques) < sum(solved)
+
+    def branch_label(self):
+        """Return the unsolved section with the fewest remaining options."""
+        unsolved = {
+            key: len(section.options)
+            for key, section in self.sections.items()
+            if len(section.options) > 1
+        }
+        return min(unsolved, key=unsolved.get)
+
+    def generate_solutions(self):
+        self.propagate()
+        if self.is_invalid or self.has_duplicates:
+            return
+        if self.is_solved:
+            yield {key: next(iter(s.options)) for key, s in self.sections.items()}
+            return
+        label = self.branch_label()
+        state = self.snapshot()
+        for option in sorted(state[label]):
+            self.restore(state)
+            self.sections[label].options = {option}
+            yield from self.generate_solutions()
+
+    def solutions(self, limit: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """Enumerate the solutions of the cross number.
+
+        The search propagates the constraints once per node and branches on
+        the section with the fewest options, restoring the propagated state
+        of the node before each branch instead of copying the whole puzzle.
+        The state of the puzzle is restored once the generator is exhausted
+        or closed.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            Maximum number of solutions to yield, all solutions if None.
+
+        Yields
+        ------
+        Dict[str, str]
+            The number filled in for each section key.
+        """
+        if limit is not None and limit < 1:
+            return
+        state = self.snapshot()
+        try:
+            for count, solution in enumerate(self.generate_solutions(), start=1):
+                yield solution
+                if count == limit:
+                    break
+        finally:
+            self.restore(state)
+
+    def count_solutions(self, limit: Optional[int] = None) -> int:
+        return sum(1 for _ in self.solutions(limit=limit))
+
+    @property
+    def is_unique(self):
+        """Check if the cross number has exactly one solution."""
+        return self.count_solutions(limit=2) == 1
+
     def get_value(self, position):
         for section in self.sections.values():
             if position in section.indexes:
@@ -1,3 +1,5 @@
+import pytest
+
 from kruiscijferraadsel import CrossNumber, NumberIntersection, NumberSection
 
 
@@ -17,3 +19,50 @@ def test_connect(words):
     cn.connect("A8-h", "B8-v", 1, 0)
     expected = NumberIntersection(s1, s2, 1, 0)
     assert cn.intersections[0] == expected
+
+
+@pytest.fixture(scope="function")
+def crossnumber(words):
+    cn = CrossNumber(words=words)
+    cn.add_section("A8-h", 4)
+    cn.add_section("A8-v", 4)
+    cn.connect("A8-h", "A8-v", 0, 0)
+    return cn
+
+
+@pytest.mark.parametrize(
+    "fixed, expected",
+    (
+        (None, 4),
+        ({"ABCD", "CDAB"}, 2),
+        ({"ABCD"}, 1),
+    ),
+)
+def test_count_solutions(crossnumber, fixed, expected):
+    if fixed is not None:
+        crossnumber.sections["A8-h"].options = fixed
+    assert crossnumber.count_solutions() == expected
+    assert crossnumber.is_unique == (expected == 1)
+
+
+def test_solutions(crossnumber):
+    crossnumber.sections["A8-h"].options = {"ABCD"}
+    assert list(crossnumber.solutions()) == [{"A8-h": "ABCD", "A8-v": "ABDC"}]
+
+
+def test_solutions_no_solution(crossnumber):
+    crossnumber.intersections[0].vertical_idx = 1
+    assert list(crossnumber.solutions()) == []
+    assert not crossnumber.is_unique
+
+
+@pytest.mark.parametrize("limit, expected", ((0, 0), (1, 1), (3, 3), (10, 4)))
+def test_solutions_limit(crossnumber, limit, expected):
+    assert len(list(crossnumber.solutions(limit=limit))) == expected
+
+
+def test_solutions_restores_state(crossnumber):
+    before = crossnumber.snapshot()
+    next(crossnumber.solutions())
+    crossnumber.count_solutions()
+    assert crossnumber.snapshot() == before